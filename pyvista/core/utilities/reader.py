@@ -1899,11 +1899,20 @@ class _PVDReader(BaseVTKReader):
         """Parse PVD file."""
         if self._filename is None:
             raise ValueError("Filename must be set")
-        tree = ElementTree.parse(self._filename)
-        root = tree.getroot()
-        dataset_elements = root[0].findall("DataSet")
+        # parse incrementally and detach each 'DataSet' from the collection
+        # (first child of the root) once consumed to keep memory bounded
         datasets = []
-        for element in dataset_elements:
+        collection = None
+        parents = []
+        for event, element in ElementTree.iterparse(self._filename, events=('start', 'end')):
+            if event == 'start':
+                if collection is None and len(parents) == 1:
+                    collection = element
+                parents.append(element)
+                continue
+            parents.pop()
+            if element.tag != 'DataSet' or not parents or parents[-1] is not collection:
+                continue
             element_attrib = element.attrib
             datasets.append(
                 PVDDataSet(
@@ -1913,6 +1922,7 @@ class _PVDReader(BaseVTKReader):
                     element_attrib.get('group'),
                 )
             )
+            collection.remove(element)
         self._datasets = sorted(datasets)
         self._time_values = sorted({dataset.time for dataset in self._datasets})
         self._time_mapping = {time: [] for time in self._time_values}
@@ -1,5 +1,7 @@
 from importlib import metadata
 import re
+import socket
+from urllib.parse import urlsplit
 
 import numpy as np
 from numpy.random import default_rng
@@ -7,6 +9,7 @@ from pytest import fixture, mark, skip
 
 import pyvista
 from pyvista import examples
+from pyvista.examples import downloads
 
 pyvista.OFF_SCREEN = True
 
@@ -191,6 +194,24 @@ def marker_names(item):
     return [marker.name for marker in item.iter_markers()]
 
 
+def has_network(timeout=2):
+    """Return ``True`` if the example data source can be reached.
+
+    Always ``True`` when the examples come from a local vtk-data mirror
+    (``PYVISTA_VTK_DATA``), since nothing is downloaded then.
+
+    """
+    if downloads._FILE_CACHE:
+        return True
+    url = urlsplit(downloads.SOURCE)
+    port = url.port or (443 if url.scheme == 'https' else 80)
+    try:
+        socket.create_connection((url.hostname, port), timeout=timeout).close()
+    except OSError:
+        return False
+    return True
+
+
 def pytest_collection_modifyitems(config, items):
     test_downloads = config.getoption("--test_downloads")
 
@@ -201,6 +222,13 @@ def pytest_collection_modifyitems(config, items):
             if 'needs_download' in marker_names(item):
                 item.add_marker(skip_downloads)
 
+    # skip all tests that need network access when offline, with a single probe
+    network_items = [item for item in items if 'network' in marker_names(item)]
+    if network_items and not has_network():
+        skip_network = mark.skip("No network access")
+        for item in network_items:
+            item.add_marker(skip_network)
+
 
 def pytest_runtest_setup(item):
     """Custom setup to handle skips based on VTK version.
@@ -0,0 +1,130 @@
+from concurrent.futures import Future
+import os
+from pathlib import Path
+import platform
+import shutil
+import threading
+
+import pytest
+
+import pyvista as pv
+from pyvista import examples
+
+# Example datasets shared by several tests in ``test_reader.py``
+_DOWNLOADS = {
+    'backward_facing_step': examples.download_backward_facing_step,
+    'naca': examples.download_naca,
+    'dicom_stack': examples.download_dicom_stack,
+    'cavity': examples.download_cavity,
+    'wavy': examples.download_wavy,
+    'dual_sphere_animation': examples.download_dual_sphere_animation,
+}
+# Fixtures returning the path of each dataset
+_FIXTURES = {
+    'backward_facing_step_file': 'backward_facing_step',
+    'naca_file': 'naca',
+    'dicom_stack_dir': 'dicom_stack',
+    'cavity_file': 'cavity',
+    'wavy_file': 'wavy',
+    'dual_sphere_animation_file': 'dual_sphere_animation',
+}
+_PREFETCH = {}
+
+
+def _prefetch(name):
+    """Return a future of the path of a dataset, downloading it if needed.
+
+    Downloads run in daemon threads so that an interrupted session (e.g. with
+    ``-x`` or Ctrl-C) exits without waiting for in-flight downloads.
+
+    """
+    if name not in _PREFETCH:
+        future = Future()
+
+        def download():
+            try:
+                future.set_result(_DOWNLOADS[name](load=False))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=download, daemon=True).start()
+        _PREFETCH[name] = future
+    return _PREFETCH[name]
+
+
+def pytest_collection_finish(session):
+    """Start downloading the datasets needed by the selected tests.
+
+    Tests marked as skipped, e.g. by the offline check of the ``network``
+    marker, do not trigger any download. Other skip conditions (``skipif``,
+    ``needs_vtk_version``) are not evaluated here, so a test skipped this way
+    may still prefetch its dataset. Nothing is prefetched on macOS, where the
+    reader tests are skipped, nor under ``pytest-xdist``, where datasets are
+    downloaded on first use so that the workers do not all fetch the same
+    files.
+
+    """
+    config = session.config
+    if config.option.collectonly or hasattr(config, 'workerinput') or platform.system() == 'Darwin':
+        return
+    for item in session.items:
+        if item.get_closest_marker('skip') is not None:
+            continue
+        for fixture_name in item.fixturenames:
+            if fixture_name in _FIXTURES:
+                _prefetch(_FIXTURES[fixture_name])
+
+
+@pytest.fixture(scope='session')
+def backward_facing_step_file():
+    return _prefetch('backward_facing_step').result()
+
+
+@pytest.fixture(scope='session')
+def naca_file():
+    return _prefetch('naca').result()
+
+
+@pytest.fixture(scope='session')
+def dicom_stack_dir():
+    return _prefetch('dicom_stack').result()
+
+
+@pytest.fixture(scope='session')
+def wavy_file():
+    return _prefetch('wavy').result()
+
+
+@pytest.fixture(scope='session')
+def dual_sphere_animation_file():
+    # downloads all the files of the animation
+    return _prefetch('dual_sphere_animation').result()
+
+
+@pytest.fixture(scope='session')
+def cavity_file():
+    return _prefetch('cavity').result()
+
+
+@pytest.fixture(scope='session')
+def fast_tmpdir(tmp_path_factory):
+    """Return a session temporary directory, kept in memory when possible.
+
+    On Linux, ``/dev/shm`` is a ``tmpfs`` mount, which avoids the sync
+    latency of slow (e.g. network) file systems when writing small files.
+
+    """
+    shm = Path('/dev/shm')
+    if platform.system() == 'Linux' and os.access(shm, os.W_OK):
+        path = shm / f'pyvista-tests-{os.getpid()}'
+        path.mkdir(exist_ok=True)
+        yield path
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        yield tmp_path_factory.mktemp('pyvista-tests')
+
+
+@pytest.fixture(scope='session')
+def base_sphere():
+    # shared across tests, copy before modifying
+    return pv.Sphere()
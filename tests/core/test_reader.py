@@ -1,5 +1,9 @@
+import asyncio
+from functools import partial
 import os
+from pathlib import Path
 import platform
+from uuid import uuid4
 
 import numpy as np
 import pytest
@@ -9,102 +13,74 @@ from pyvista import examples
 from pyvista.core.utilities.fileio import _try_imageio_imread
 from pyvista.examples.downloads import download_file
 
-HAS_IMAGEIO = True
-try:
-    import imageio  # noqa: F401
-except ModuleNotFoundError:
-    HAS_IMAGEIO = False
-
-
 pytestmark = pytest.mark.skipif(
     platform.system() == 'Darwin', reason='MacOS testing on Azure fails when downloading'
 )
 skip_windows = pytest.mark.skipif(os.name == 'nt', reason='Test fails on Windows')
 
+_VTK_GE_91 = pv.vtk_version_info >= (9, 1, 0)
 
-def test_get_reader_fail():
-    with pytest.raises(ValueError):
-        pv.get_reader("not_a_supported_file.no_data")
-
-
-def test_reader_invalid_file():
-    # cannot use the BaseReader
-    with pytest.raises(FileNotFoundError, match='does not exist'):
-        pv.DICOMReader('dummy/')
-
-
-def test_xmlimagedatareader(tmpdir):
-    tmpfile = tmpdir.join("temp.vti")
-    mesh = pv.ImageData()
-    mesh.save(tmpfile.strpath)
-
-    reader = pv.get_reader(tmpfile.strpath)
-    assert reader.path == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pv.ImageData)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
+# vtk version 9.1.0 changed the way OpenFOAM patch names are handled
+_PATCH_ARRAY_KEY = 'boundary' if _VTK_GE_91 else 'Patches'
+_PATCH_PREFIX = 'patch/' if _VTK_GE_91 else ''
 
+# round-trip tests write binary files, which are smaller and faster to parse
+_SAVE_KWARGS = dict(binary=True)
 
-def test_xmlrectilineargridreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtr")
-    mesh = pv.RectilinearGrid()
-    mesh.save(tmpfile.strpath)
 
-    reader = pv.get_reader(tmpfile.strpath)
-    assert reader.path == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pv.RectilinearGrid)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
+@pytest.fixture()
+def cavity_reader(cavity_file):
+    return pv.get_reader(cavity_file)
 
 
-def test_xmlunstructuredgridreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtu")
-    mesh = pv.UnstructuredGrid()
-    mesh.save(tmpfile.strpath)
+@pytest.fixture(scope='module')
+def shared_cavity_reader(cavity_file):
+    # shared across tests and never reset: each test must set every state it
+    # relies on (e.g. skip_zero_time is left to True by a previous test)
+    return pv.get_reader(cavity_file)
 
-    reader = pv.get_reader(tmpfile.strpath)
-    assert reader.path == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pv.UnstructuredGrid)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
 
+def test_get_reader_fail():
+    with pytest.raises(ValueError):
+        pv.get_reader("not_a_supported_file.no_data")
 
-def test_xmlpolydatareader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtp")
-    mesh = pv.Sphere()
-    mesh.save(tmpfile.strpath)
 
-    reader = pv.get_reader(tmpfile.strpath)
-    assert reader.path == tmpfile.strpath
-    new_mesh = reader.read()
-    assert isinstance(new_mesh, pv.PolyData)
-    assert new_mesh.n_points == mesh.n_points
-    assert new_mesh.n_cells == mesh.n_cells
+def test_reader_invalid_file():
+    # cannot use the BaseReader
+    with pytest.raises(FileNotFoundError, match='does not exist'):
+        pv.DICOMReader('dummy/')
 
 
-def test_xmlstructuredgridreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vts")
-    mesh = pv.StructuredGrid()
-    mesh.save(tmpfile.strpath)
+@pytest.mark.parametrize(
+    'ext,factory,expected_cls',
+    [
+        ('vti', pv.ImageData, pv.ImageData),
+        ('vtr', pv.RectilinearGrid, pv.RectilinearGrid),
+        ('vtu', pv.UnstructuredGrid, pv.UnstructuredGrid),
+        ('vtp', pv.Sphere, pv.PolyData),
+        ('vts', pv.StructuredGrid, pv.StructuredGrid),
+    ],
+)
+def test_xmlreader(fast_tmpdir, ext, factory, expected_cls):
+    tmpfile = str(fast_tmpdir / f"temp_{uuid4().hex}.{ext}")
+    mesh = factory()
+    mesh.save(tmpfile, **_SAVE_KWARGS)
 
-    reader = pv.get_reader(tmpfile.strpath)
-    assert reader.path == tmpfile.strpath
+    reader = pv.get_reader(tmpfile)
+    assert reader.path == tmpfile
     new_mesh = reader.read()
-    assert isinstance(new_mesh, pv.StructuredGrid)
+    assert isinstance(new_mesh, expected_cls)
     assert new_mesh.n_points == mesh.n_points
     assert new_mesh.n_cells == mesh.n_cells
 
 
-def test_xmlmultiblockreader(tmpdir):
-    tmpfile = tmpdir.join("temp.vtm")
-    mesh = pv.MultiBlock([pv.Sphere() for i in range(5)])
-    mesh.save(tmpfile.strpath)
+def test_xmlmultiblockreader(fast_tmpdir, base_sphere):
+    tmpfile = str(fast_tmpdir / f"temp_{uuid4().hex}.vtm")
+    mesh = pv.MultiBlock([base_sphere.copy(deep=False) for _ in range(5)])
+    mesh.save(tmpfile, **_SAVE_KWARGS)
 
-    reader = pv.get_reader(tmpfile.strpath)
-    assert reader.path == tmpfile.strpath
+    reader = pv.get_reader(tmpfile)
+    assert reader.path == tmpfile
     new_mesh = reader.read()
     assert isinstance(new_mesh, pv.MultiBlock)
     assert new_mesh.n_blocks == mesh.n_blocks
@@ -113,15 +89,15 @@ def test_xmlmultiblockreader(tmpdir):
         assert new_mesh[i].n_cells == mesh[i].n_cells
 
 
-def test_reader_cell_point_data(tmpdir):
-    tmpfile = tmpdir.join("temp.vtp")
-    mesh = pv.Sphere()
-    mesh['height'] = mesh.points[:, 1]
-    mesh['id'] = np.arange(mesh.n_cells)
-    mesh.save(tmpfile.strpath)
+def test_reader_cell_point_data(fast_tmpdir, base_sphere):
+    tmpfile = str(fast_tmpdir / f"temp_{uuid4().hex}.vtp")
+    mesh = base_sphere.copy(deep=True)
+    mesh['height'] = np.ascontiguousarray(mesh.points[:, 1])
+    mesh['id'] = np.arange(mesh.n_cells, dtype=np.int32)
+    mesh.save(tmpfile, **_SAVE_KWARGS)
     # mesh has an additional 'Normals' point data array
 
-    reader = pv.get_reader(tmpfile.strpath)
+    reader = pv.get_reader(tmpfile)
 
     assert reader.number_cell_arrays == 1
     assert reader.number_point_arrays == 2
@@ -135,33 +111,33 @@ def test_reader_cell_point_data(tmpdir):
     assert reader.cell_array_status('id') is True
     assert reader.point_array_status('Normals') is True
 
-    reader.disable_all_cell_arrays()
-    assert reader.cell_array_status('id') is False
-
-    reader.disable_all_point_arrays()
-    assert reader.all_point_arrays_status == {'Normals': False, 'height': False}
-
-    reader.enable_all_cell_arrays()
-    assert reader.cell_array_status('id') is True
-
-    reader.enable_all_point_arrays()
-    assert reader.all_point_arrays_status == {'Normals': True, 'height': True}
-
-    reader.disable_cell_array('id')
-    assert reader.cell_array_status('id') is False
-
-    reader.disable_point_array('Normals')
-    assert reader.point_array_status('Normals') is False
-
-    reader.enable_cell_array('id')
-    assert reader.cell_array_status('id') is True
-
-    reader.enable_point_array('Normals')
-    assert reader.point_array_status('Normals') is True
+    # each operation with the resulting status of all the cell and point arrays
+    operations = [
+        (reader.disable_all_cell_arrays, {'id': False, 'Normals': True, 'height': True}),
+        (reader.disable_all_point_arrays, {'id': False, 'Normals': False, 'height': False}),
+        (reader.enable_all_cell_arrays, {'id': True, 'Normals': False, 'height': False}),
+        (reader.enable_all_point_arrays, {'id': True, 'Normals': True, 'height': True}),
+        (partial(reader.disable_cell_array, 'id'), {'id': False, 'Normals': True, 'height': True}),
+        (
+            partial(reader.disable_point_array, 'Normals'),
+            {'id': False, 'Normals': False, 'height': True},
+        ),
+        (partial(reader.enable_cell_array, 'id'), {'id': True, 'Normals': False, 'height': True}),
+        (
+            partial(reader.enable_point_array, 'Normals'),
+            {'id': True, 'Normals': True, 'height': True},
+        ),
+    ]
+    trace = []
+    for operation, _ in operations:
+        operation()
+        trace.append({**reader.all_cell_arrays_status, **reader.all_point_arrays_status})
+    assert trace == [expected for _, expected in operations]
 
 
-def test_ensightreader_arrays():
-    filename = examples.download_backward_facing_step(load=False)
+@pytest.mark.network
+def test_ensightreader_arrays(backward_facing_step_file):
+    filename = backward_facing_step_file
 
     reader = pv.get_reader(filename)
     assert reader.path == filename
@@ -200,7 +176,7 @@ def test_ensightreader_arrays():
     assert isinstance(mesh, pv.MultiBlock)
 
     for i in range(mesh.n_blocks):
-        assert all([mesh[i].n_points, mesh[i].n_cells])
+        assert mesh[i].n_points and mesh[i].n_cells
         assert mesh[i].array_names == ['k']
 
     # re-enable all cell arrays and read again
@@ -209,7 +185,7 @@ def test_ensightreader_arrays():
     assert isinstance(all_mesh, pv.MultiBlock)
 
     for i in range(all_mesh.n_blocks):
-        assert all([all_mesh[i].n_points, all_mesh[i].n_cells])
+        assert all_mesh[i].n_points and all_mesh[i].n_cells
         assert all_mesh[i].array_names == [
             'v2',
             'nut',
@@ -223,8 +199,9 @@ def test_ensightreader_arrays():
         ]
 
 
-def test_ensightreader_timepoints():
-    filename = examples.download_naca(load=False)
+@pytest.mark.network
+def test_ensightreader_timepoints(naca_file):
+    filename = naca_file
 
     reader = pv.get_reader(filename)
     assert reader.path == filename
@@ -252,9 +229,11 @@ def test_ensightreader_timepoints():
         reader.set_active_time_value(1000.0)
 
 
-def test_dcmreader(tmpdir):
+@pytest.mark.network
+@pytest.mark.xdist_group('dicom_stack')
+def test_dcmreader(dicom_stack_dir):
     # Test reading directory (image stack)
-    directory = examples.download_dicom_stack(load=False)
+    directory = dicom_stack_dir
     reader = pv.DICOMReader(directory)  # ``get_reader`` doesn't support directories
     assert directory in str(reader)
     assert isinstance(reader, pv.DICOMReader)
@@ -262,49 +241,65 @@ def test_dcmreader(tmpdir):
 
     mesh = reader.read()
     assert isinstance(mesh, pv.ImageData)
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
     # Test reading single file (*.dcm)
-    filename = os.path.join(directory, "1-1.dcm")
+    filename = str(Path(directory) / "1-1.dcm")
     reader = pv.get_reader(filename)
     assert isinstance(reader, pv.DICOMReader)
     assert reader.path == filename
 
     mesh = reader.read()
     assert isinstance(mesh, pv.ImageData)
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_plyreader():
-    filename = examples.spherefile
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.PLYReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_objreader():
-    filename = examples.download_doorman(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.OBJReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_stlreader():
-    filename = examples.download_gears(load=False)
+    assert mesh.n_points and mesh.n_cells
+
+
+SIMPLE_READERS = [
+    (examples.spherefile, pv.PLYReader),
+    (examples.download_doorman, pv.OBJReader),
+    (examples.download_gears, pv.STLReader),
+    (examples.hexbeamfile, pv.VTKDataSetReader),
+    (examples.download_teapot, pv.BYUReader),
+    (examples.download_clown, pv.FacetReader),
+    (examples.download_masonry_texture, pv.BMPReader),
+    (examples.download_st_helens, pv.DEMReader),
+    (examples.planets.download_mars_surface, pv.JPEGReader),
+    (examples.download_chest, pv.MetaImageReader),
+    (examples.download_brain_atlas_with_sides, pv.NIFTIReader),
+    (examples.download_beach, pv.NRRDReader),
+    (examples.download_vtk_logo, pv.PNGReader),
+    (examples.download_gourds_pnm, pv.PNMReader),
+    (examples.download_knee_full, pv.SLCReader),
+    (examples.download_crater_imagery, pv.TIFFReader),
+    (examples.download_parched_canal_4k, pv.HDRReader),
+    (examples.download_cells_nd, pv.AVSucdReader),
+]
+
+
+@pytest.mark.parametrize(
+    'source,reader_cls',
+    [
+        pytest.param(
+            source,
+            reader_cls,
+            marks=pytest.mark.network if callable(source) else (),
+            id=reader_cls.__name__,
+        )
+        for source, reader_cls in SIMPLE_READERS
+    ],
+)
+def test_simple_reader(source, reader_cls):
+    # ``source`` is either a local example file or a download function
+    filename = source(load=False) if callable(source) else source
     reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.STLReader)
+    assert isinstance(reader, reader_cls)
     assert reader.path == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
 
 
+@pytest.mark.network
 def test_tecplotreader():
     filename = examples.download_tecplot_ascii(load=False)
     reader = pv.get_reader(filename)
@@ -312,67 +307,72 @@ def test_tecplotreader():
     assert reader.path == filename
 
     mesh = reader.read()
-    assert all([mesh[0].n_points, mesh[0].n_cells])
+    assert mesh[0].n_points and mesh[0].n_cells
 
 
-def test_vtkreader():
-    filename = examples.hexbeamfile
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.VTKDataSetReader)
-    assert reader.path == filename
+async def _parallel_downloads(names):
+    # run the blocking downloads concurrently in the default executor
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        *(loop.run_in_executor(None, download_file, name) for name in names)
+    )
 
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
 
+@pytest.fixture(scope='module')
+def plot3d_files():
+    return asyncio.run(_parallel_downloads(['multi-bin.xyz', 'multi-bin.q']))
 
-def test_byureader():
-    filename = examples.download_teapot(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.BYUReader)
-    assert reader.path == filename
 
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+@pytest.fixture(scope='module')
+def plot3d_xyz(plot3d_files):
+    return plot3d_files[0]
 
 
-def test_facetreader():
-    filename = examples.download_clown(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.FacetReader)
-    assert reader.path == filename
+@pytest.fixture(scope='module')
+def plot3d_q(plot3d_files):
+    return plot3d_files[1]
 
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+
+@pytest.fixture(scope='module')
+def plot3d_property_reader(plot3d_xyz):
+    # shared by the tests that only exercise property getters and setters,
+    # state is not reset between tests: each test must set every property it
+    # asserts on
+    return pv.MultiBlockPlot3DReader(plot3d_xyz)
 
 
-def test_plot3dmetareader():
-    filename = download_file('multi.p3d')
-    download_file('multi-bin.xyz')
-    download_file('multi-bin.q')
-    download_file('multi-bin.f')
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_plot3dmetareader(plot3d_files):
+    # the meta file references the xyz and q files as well as the function file
+    filename, _ = asyncio.run(_parallel_downloads(['multi.p3d', 'multi-bin.f']))
     reader = pv.get_reader(filename)
     assert isinstance(reader, pv.Plot3DMetaReader)
     assert reader.path == filename
 
     mesh = reader.read()
     for m in mesh:
-        assert all([m.n_points, m.n_cells])
+        assert m.n_points and m.n_cells
 
 
-def test_multiblockplot3dreader():
-    filename = download_file('multi-bin.xyz')
-    q_filename = download_file('multi-bin.q')
-    reader = pv.MultiBlockPlot3DReader(filename)
-    assert reader.path == filename
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader(plot3d_xyz):
+    reader = pv.MultiBlockPlot3DReader(plot3d_xyz)
+    assert reader.path == plot3d_xyz
 
     mesh = reader.read()
     for m in mesh:
-        assert all([m.n_points, m.n_cells])
+        assert m.n_points and m.n_cells
         assert len(m.array_names) == 0
 
-    # Reader doesn't yet support reusability
-    reader = pv.MultiBlockPlot3DReader(filename)
-    reader.add_q_files(q_filename)
+
+# Reader doesn't yet support reusability, hence a new reader for each read
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_functions(plot3d_xyz, plot3d_q):
+    reader = pv.MultiBlockPlot3DReader(plot3d_xyz)
+    reader.add_q_files(plot3d_q)
 
     reader.add_function(112)  # add by int
     reader.add_function(pv.reader.Plot3DFunctionEnum.PRESSURE_GRADIENT)  # add by enum
@@ -392,47 +392,69 @@ def test_multiblockplot3dreader():
     assert 'KineticEnergy' in mesh[0].point_data
     assert 'Entropy' not in mesh[0].point_data
 
-    reader = pv.MultiBlockPlot3DReader(filename)
-    reader.add_q_files([q_filename])
+
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_q_files_list(plot3d_xyz, plot3d_q):
+    reader = pv.MultiBlockPlot3DReader(plot3d_xyz)
+    reader.add_q_files([plot3d_q])
     mesh = reader.read()
     for m in mesh:
         assert len(m.array_names) > 0
 
-    reader = pv.MultiBlockPlot3DReader(filename)
 
-    # get/set of `auto_detect_format`
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_remove_all_functions(plot3d_xyz, plot3d_q):
+    reader = pv.MultiBlockPlot3DReader(plot3d_xyz)
+    reader.add_q_files(plot3d_q)
+    reader.add_function(reader.ENTROPY)
+    reader.remove_all_functions()
+    mesh_no_functions = reader.read()
+    assert 'ENTROPY' not in mesh_no_functions[0].point_data
+
+
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_auto_detect_format(plot3d_property_reader):
+    reader = plot3d_property_reader
     reader.auto_detect_format = False
     assert reader.auto_detect_format is False
     reader.auto_detect_format = True
     assert reader.auto_detect_format is True
 
-    # get/set of `preserve_intermediate_functions`
+
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_preserve_intermediate_functions(plot3d_property_reader):
+    reader = plot3d_property_reader
     reader.preserve_intermediate_functions = False
     assert reader.preserve_intermediate_functions is False
     reader.preserve_intermediate_functions = True
     assert reader.preserve_intermediate_functions is True
 
-    # get/set of `gamma`
+
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_gamma(plot3d_property_reader):
+    reader = plot3d_property_reader
     reader.gamma = 1.5
     assert reader.gamma == 1.5
     reader.gamma = 99
     assert reader.gamma == 99
 
-    # get/set of `r_gas_constant`
+
+@pytest.mark.network
+@pytest.mark.xdist_group('plot3d')
+def test_multiblockplot3dreader_r_gas_constant(plot3d_property_reader):
+    reader = plot3d_property_reader
     reader.r_gas_constant = 5
     assert reader.r_gas_constant == 5
     reader.r_gas_constant = 10
     assert reader.r_gas_constant == 10
 
-    # check removing all functions
-    reader = pv.MultiBlockPlot3DReader(filename)
-    reader.add_q_files(q_filename)
-    reader.add_function(reader.ENTROPY)
-    reader.remove_all_functions()
-    mesh_no_functions = reader.read()
-    assert 'ENTROPY' not in mesh_no_functions[0].point_data
-
 
+@pytest.mark.network
 def test_binarymarchingcubesreader():
     filename = examples.download_pine_roots(load=False)
     reader = pv.get_reader(filename)
@@ -440,13 +462,37 @@ def test_binarymarchingcubesreader():
     assert reader.path == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
     read_mesh = pv.read(filename)
     assert mesh == read_mesh
 
 
-def test_pvdreader():
-    filename = examples.download_wavy(load=False)
+def test_pvdreader_parse(tmp_path, base_sphere):
+    base_sphere.save(tmp_path / 'sphere.vtp')
+    collection = ''.join(
+        f'<DataSet timestep="{time}" part="{part}" file="sphere.vtp"/>\n'
+        for time in (1.0, 0.0, 0.5)
+        for part in (1, 0)
+    )
+    # 'DataSet' elements outside of the collection are ignored
+    (tmp_path / 'test.pvd').write_text(
+        '<?xml version="1.0"?>\n<VTKFile type="Collection">\n'
+        f'<Collection>\n{collection}</Collection>\n'
+        '<Other><DataSet timestep="2.0" file="missing.vtp"/></Other>\n</VTKFile>\n'
+    )
+
+    reader = pv.get_reader(str(tmp_path / 'test.pvd'))
+    assert reader.reader._time_values == [0.0, 0.5, 1.0]
+    assert reader.reader._datasets == [
+        pv.PVDDataSet(time, part, 'sphere.vtp', None) for time in (0.0, 0.5, 1.0) for part in (0, 1)
+    ]
+    assert len(reader.active_datasets) == 2
+
+
+@pytest.mark.network
+@pytest.mark.xdist_group('wavy')
+def test_pvdreader(wavy_file):
+    filename = wavy_file
     reader = pv.get_reader(filename)
     assert isinstance(reader, pv.PVDReader)
     assert isinstance(reader.reader, pv.core.utilities.reader._PVDReader)
@@ -485,10 +531,12 @@ def test_pvdreader():
     assert isinstance(mesh[0], pv.StructuredGrid)
 
 
-def test_pvdreader_no_time_group():
-    filename = examples.download_dual_sphere_animation(load=False)  # download all the files
+@pytest.mark.network
+@pytest.mark.xdist_group('dual_sphere')
+def test_pvdreader_no_time_group(dual_sphere_animation_file):
+    filename = dual_sphere_animation_file
     # Use a pvd file that has no timestep or group and two parts.
-    filename = os.path.join(os.path.dirname(filename), 'dualSphereNoTime.pvd')
+    filename = str(Path(filename).parent / 'dualSphereNoTime.pvd')
 
     reader = pv.PVDReader(filename)
     assert reader.time_values == [0.0]
@@ -501,11 +549,13 @@ def test_pvdreader_no_time_group():
         assert dataset.part == i
 
 
+@pytest.mark.network
+@pytest.mark.xdist_group('dual_sphere')
 @skip_windows
-def test_pvdreader_no_part_group():
-    filename = examples.download_dual_sphere_animation(load=False)  # download all the files
+def test_pvdreader_no_part_group(dual_sphere_animation_file):
+    filename = dual_sphere_animation_file
     # Use a pvd file that has no parts and with timesteps.
-    filename = os.path.join(os.path.dirname(filename), 'dualSphereAnimation4NoPart.pvd')
+    filename = str(Path(filename).parent / 'dualSphereAnimation4NoPart.pvd')
 
     reader = pv.PVDReader(filename)
     assert reader.active_time_value == 0.0
@@ -519,13 +569,10 @@ def test_pvdreader_no_part_group():
         assert dataset.part == 0
 
 
-def get_cavity_reader():
-    filename = examples.download_cavity(load=False)
-    return pv.get_reader(filename)
-
-
-def test_openfoamreader_arrays_time():
-    reader = get_cavity_reader()
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoamreader_arrays_time(cavity_reader):
+    reader = cavity_reader
     assert isinstance(reader, pv.OpenFOAMReader)
 
     assert reader.number_point_arrays == 0
@@ -535,12 +582,14 @@ def test_openfoamreader_arrays_time():
     assert reader.time_values == [0.0, 0.5, 1.0, 1.5, 2.0, 2.5]
 
 
-def test_openfoamreader_active_time():
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoamreader_active_time(cavity_reader):
     # vtk < 9.1.0 does not support
-    if pv.vtk_version_info < (9, 1, 0):
+    if not _VTK_GE_91:
         pytest.xfail("OpenFOAMReader GetTimeValue missing on vtk<9.1.0")
 
-    reader = get_cavity_reader()
+    reader = cavity_reader
     assert reader.active_time_value == 0.0
     reader.set_active_time_point(1)
     assert reader.active_time_value == 0.5
@@ -553,72 +602,49 @@ def test_openfoamreader_active_time():
         reader.set_active_time_value(1000)
 
 
-def test_openfoamreader_read_data_time_value():
-    reader = get_cavity_reader()
-
-    reader.set_active_time_value(0.0)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 0.0, 0.0, 1e-10)
-
-    reader.set_active_time_value(0.5)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.524879113887437e-05, 0.0, 1e-10)
-
-    reader.set_active_time_value(1.0)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.5253094867803156e-05, 0.0, 1e-10)
-
-    reader.set_active_time_value(1.5)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.525657641352154e-05, 0.0, 1e-10)
-
-    reader.set_active_time_value(2.0)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.5258551836013794e-05, 0.0, 1e-10)
-
-    reader.set_active_time_value(2.5)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.525951953837648e-05, 0.0, 1e-10)
-
-
-def test_openfoamreader_read_data_time_point():
-    reader = get_cavity_reader()
+# (time value, mean of the y component of the cell data 'U') of the cavity case
+CAVITY_U_MEANS = [
+    (0.0, 0.0),
+    (0.5, 4.524879113887437e-05),
+    (1.0, 4.5253094867803156e-05),
+    (1.5, 4.525657641352154e-05),
+    (2.0, 4.5258551836013794e-05),
+    (2.5, 4.525951953837648e-05),
+]
 
-    reader.set_active_time_point(0)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 0.0, 0.0, 1e-10)
-
-    reader.set_active_time_point(1)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.524879113887437e-05, 0.0, 1e-10)
-
-    reader.set_active_time_point(2)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.5253094867803156e-05, 0.0, 1e-10)
-
-    reader.set_active_time_point(3)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.525657641352154e-05, 0.0, 1e-10)
 
-    reader.set_active_time_point(4)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.5258551836013794e-05, 0.0, 1e-10)
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+@pytest.mark.parametrize('mode', ['value', 'point'])
+@pytest.mark.parametrize('time_point', range(len(CAVITY_U_MEANS)))
+def test_openfoamreader_read_data(shared_cavity_reader, mode, time_point):
+    reader = shared_cavity_reader
+    reader.case_type = 'reconstructed'
+    reader.skip_zero_time = False
+    time_value, expected = CAVITY_U_MEANS[time_point]
 
-    reader.set_active_time_point(5)
-    data = reader.read()["internalMesh"]
-    assert np.isclose(data.cell_data["U"][:, 1].mean(), 4.525951953837648e-05, 0.0, 1e-10)
+    if mode == 'value':
+        reader.set_active_time_value(time_value)
+    else:
+        reader.set_active_time_point(time_point)
+    velocity = reader.read()["internalMesh"].cell_data["U"]
+    np.testing.assert_allclose(velocity[:, 1].mean(), expected, rtol=0.0, atol=1e-10)
 
 
-def test_openfoam_decompose_polyhedra():
-    reader = get_cavity_reader()
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoam_decompose_polyhedra(shared_cavity_reader):
+    reader = shared_cavity_reader
     reader.decompose_polyhedra = False
     assert reader.decompose_polyhedra is False
     reader.decompose_polyhedra = True
     assert reader.decompose_polyhedra is True
 
 
-def test_openfoam_skip_zero_time():
-    reader = get_cavity_reader()
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoam_skip_zero_time(shared_cavity_reader):
+    reader = shared_cavity_reader
 
     reader.skip_zero_time = True
     assert reader.skip_zero_time is True
@@ -635,48 +661,43 @@ def test_openfoam_skip_zero_time():
     assert 0.0 not in reader.time_values
 
 
-def test_openfoam_cell_to_point_default():
-    reader = get_cavity_reader()
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoam_cell_to_point_default(cavity_file):
+    reader = pv.get_reader(cavity_file)
     mesh = reader.read()
     assert reader.cell_to_point_creation is True
     assert mesh[0].n_arrays == 4
 
-    reader = get_cavity_reader()
+    reader = pv.get_reader(cavity_file)
     reader.cell_to_point_creation = False
     assert reader.cell_to_point_creation is False
     mesh = reader.read()
     assert mesh[0].n_arrays == 2
 
-    reader = get_cavity_reader()
+    reader = pv.get_reader(cavity_file)
     mesh = reader.read()
     reader.cell_to_point_creation = True
     assert reader.cell_to_point_creation is True
     assert mesh[0].n_arrays == 4
 
 
-def test_openfoam_patch_arrays():
-    # vtk version 9.1.0 changed the way patch names are handled.
-    vtk_version = pv.vtk_version_info
-    if vtk_version >= (9, 1, 0):
-        patch_array_key = 'boundary'
-        reader_patch_prefix = 'patch/'
-    else:
-        patch_array_key = 'Patches'
-        reader_patch_prefix = ''
-
-    reader = get_cavity_reader()
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoam_patch_arrays(cavity_file):
+    reader = pv.get_reader(cavity_file)
     assert reader.number_patch_arrays == 4
     assert reader.patch_array_names == [
         'internalMesh',
-        f'{reader_patch_prefix}movingWall',
-        f'{reader_patch_prefix}fixedWalls',
-        f'{reader_patch_prefix}frontAndBack',
+        f'{_PATCH_PREFIX}movingWall',
+        f'{_PATCH_PREFIX}fixedWalls',
+        f'{_PATCH_PREFIX}frontAndBack',
     ]
     assert reader.all_patch_arrays_status == {
         'internalMesh': True,
-        f'{reader_patch_prefix}movingWall': True,
-        f'{reader_patch_prefix}fixedWalls': True,
-        f'{reader_patch_prefix}frontAndBack': True,
+        f'{_PATCH_PREFIX}movingWall': True,
+        f'{_PATCH_PREFIX}fixedWalls': True,
+        f'{_PATCH_PREFIX}frontAndBack': True,
     }
 
     # first only read in 'internalMesh'
@@ -684,35 +705,37 @@ def test_openfoam_patch_arrays():
         reader.disable_patch_array(patch_array)
     assert reader.all_patch_arrays_status == {
         'internalMesh': True,
-        f'{reader_patch_prefix}movingWall': False,
-        f'{reader_patch_prefix}fixedWalls': False,
-        f'{reader_patch_prefix}frontAndBack': False,
+        f'{_PATCH_PREFIX}movingWall': False,
+        f'{_PATCH_PREFIX}fixedWalls': False,
+        f'{_PATCH_PREFIX}frontAndBack': False,
     }
     mesh = reader.read()
     assert mesh.n_blocks == 1
-    assert patch_array_key not in mesh.keys()
+    assert _PATCH_ARRAY_KEY not in mesh.keys()
 
     # now read in one more patch
-    reader = get_cavity_reader()
+    reader = pv.get_reader(cavity_file)
     reader.disable_all_patch_arrays()
     reader.enable_patch_array('internalMesh')
-    reader.enable_patch_array(f'{reader_patch_prefix}fixedWalls')
+    reader.enable_patch_array(f'{_PATCH_PREFIX}fixedWalls')
     mesh = reader.read()
     assert mesh.n_blocks == 2
-    assert patch_array_key in mesh.keys()
-    assert mesh[patch_array_key].keys() == ['fixedWalls']
+    assert _PATCH_ARRAY_KEY in mesh.keys()
+    assert mesh[_PATCH_ARRAY_KEY].keys() == ['fixedWalls']
 
     # check multiple patch arrays without 'internalMesh'
-    reader = get_cavity_reader()
+    reader = pv.get_reader(cavity_file)
     reader.disable_patch_array('internalMesh')
     mesh = reader.read()
     assert mesh.n_blocks == 1
-    assert patch_array_key in mesh.keys()
-    assert mesh[patch_array_key].keys() == ['movingWall', 'fixedWalls', 'frontAndBack']
+    assert _PATCH_ARRAY_KEY in mesh.keys()
+    assert mesh[_PATCH_ARRAY_KEY].keys() == ['movingWall', 'fixedWalls', 'frontAndBack']
 
 
-def test_openfoam_case_type():
-    reader = get_cavity_reader()
+@pytest.mark.network
+@pytest.mark.xdist_group('cavity')
+def test_openfoam_case_type(shared_cavity_reader):
+    reader = shared_cavity_reader
     reader.case_type = 'decomposed'
     assert reader.case_type == 'decomposed'
     reader.case_type = 'reconstructed'
@@ -721,6 +744,7 @@ def test_openfoam_case_type():
         reader.case_type = 'wrong_value'
 
 
+@pytest.mark.network
 @pytest.mark.needs_vtk_version(9, 1)
 def test_read_cgns():
     filename = examples.download_cgns_structured(load=False)
@@ -775,126 +799,7 @@ def test_read_cgns():
     assert reader.family_array_status('inflow') is True
 
 
-def test_bmpreader():
-    filename = examples.download_masonry_texture(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.BMPReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_demreader():
-    filename = examples.download_st_helens(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.DEMReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_jpegreader():
-    filename = examples.planets.download_mars_surface(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.JPEGReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_meta_image_reader():
-    filename = examples.download_chest(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.MetaImageReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_nifti_reader():
-    filename = examples.download_brain_atlas_with_sides(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.NIFTIReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_nrrd_reader():
-    filename = examples.download_beach(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.NRRDReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_png_reader():
-    filename = examples.download_vtk_logo(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.PNGReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_pnm_reader():
-    filename = examples.download_gourds_pnm(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.PNMReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_slc_reader():
-    filename = examples.download_knee_full(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.SLCReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_tiff_reader():
-    filename = examples.download_crater_imagery(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.TIFFReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_hdr_reader():
-    filename = examples.download_parched_canal_4k(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.HDRReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
-def test_avsucd_reader():
-    filename = examples.download_cells_nd(load=False)
-    reader = pv.get_reader(filename)
-    assert isinstance(reader, pv.AVSucdReader)
-    assert reader.path == filename
-
-    mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
-
-
+@pytest.mark.network
 @pytest.mark.needs_vtk_version(9, 1)
 def test_hdf_reader():
     filename = examples.download_can_crushed_hdf(load=False)
@@ -903,12 +808,13 @@ def test_hdf_reader():
     assert reader.path == filename
 
     mesh = reader.read()
-    assert all([mesh.n_points, mesh.n_cells])
+    assert mesh.n_points and mesh.n_cells
     assert mesh.n_points == 6724
     assert 'VEL' in mesh.point_data
     assert mesh.n_cells == 4800
 
 
+@pytest.mark.network
 def test_xdmf_reader():
     filename = examples.download_meshio_xdmf(load=False)
 
@@ -954,7 +860,7 @@ def test_xdmf_reader():
         reader.set_active_time_value(1000.0)
 
 
-@pytest.mark.skipif(not HAS_IMAGEIO, reason="Requires imageio")
 def test_try_imageio_imread():
+    imageio = pytest.importorskip('imageio')
     img = _try_imageio_imread(examples.mapfile)
     assert isinstance(img, (imageio.core.util.Array, np.ndarray))